@@ -73,7 +73,10 @@ audio_service = None
 teaching_service = None
 quiz_service = None
 
-if SERVICES_AVAILABLE:
+def _initialize_services():
+    """(Re)build the module-level service singletons, with retries."""
+    global chat_service, document_service, audio_service, teaching_service, quiz_service
+    global SERVICES_AVAILABLE
     MAX_RETRIES = 3
     RETRY_DELAY = 5  # seconds
     for attempt in range(MAX_RETRIES):
@@ -95,6 +98,40 @@ if SERVICES_AVAILABLE:
                 logging.error("❌ All retries failed. Some services will be unavailable.")
                 SERVICES_AVAILABLE = False
 
+
+def rebuild_services():
+    """
+    Rebuild every service singleton in the current process.
+
+    Called from the gunicorn post_fork hook: with preload_app the services
+    above are constructed at import time in the master, so forked workers
+    inherit its live TLS connections (Chroma Cloud, Sarvam, OpenAI) and
+    concurrent workers could interleave writes on the same inherited
+    sockets. Clearing the memoized client getters and reconstructing the
+    services gives each worker connections of its own.
+    """
+    if not SERVICES_AVAILABLE:
+        return
+    from core.cloud_vectorizer import get_cloud_vectorizer
+    from services.sarvam_service import get_sarvam_service
+    from utils.openai_clients import get_embeddings
+    import services.document_service as document_service_module
+    get_cloud_vectorizer.cache_clear()
+    get_sarvam_service.cache_clear()
+    get_embeddings.cache_clear()
+    for getter in (
+        document_service_module._get_pdf_extractor,
+        document_service_module._get_text_chunker,
+        document_service_module._get_vectorizer,
+        document_service_module._get_course_generator,
+    ):
+        getter.cache_clear()
+    _initialize_services()
+
+
+if SERVICES_AVAILABLE:
+    _initialize_services()
+
 # ===== COURSE MANAGEMENT ENDPOINTS =====
 
 @app.post("/api/upload-pdfs")
@@ -180,6 +217,48 @@ async def get_course_content(course_id: str):
         logging.error(f"Error loading course {course_id}: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/api/course/{course_id}/index")
+async def index_course_content(course_id: str, defer: bool = False):
+    """
+    Index a course's content into the RAG vector store.
+
+    With defer=true (ChromaDB Cloud only) the chunks are embedded through
+    the OpenAI Batch API at half cost; the response carries a batch_id to
+    poll /api/embedding-batches/{batch_id}/apply with once the batch
+    completes (up to 24h).
+    """
+    if not SERVICES_AVAILABLE or not chat_service:
+        raise HTTPException(status_code=503, detail="Chat service not available")
+
+    course = await get_course_content(course_id)
+    try:
+        batch_id = chat_service.update_with_course_content(course, defer=defer)
+    except Exception as e:
+        logging.error(f"Error indexing course {course_id}: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+    if batch_id:
+        return {"message": "Embedding batch submitted", "batch_id": batch_id}
+    return {"message": "Course content indexed"}
+
+@app.post("/api/embedding-batches/{batch_id}/apply")
+async def apply_embedding_batch(batch_id: str):
+    """Apply a completed deferred embedding batch to the vector store."""
+    if not SERVICES_AVAILABLE or not chat_service:
+        raise HTTPException(status_code=503, detail="Chat service not available")
+    if not config.USE_CHROMA_CLOUD:
+        raise HTTPException(status_code=400, detail="Embedding batches require ChromaDB Cloud")
+
+    try:
+        from core.cloud_vectorizer import get_cloud_vectorizer
+        applied = get_cloud_vectorizer().apply_embedding_batch(batch_id)
+    except Exception as e:
+        logging.error(f"Error applying embedding batch {batch_id}: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+    # applied=False means the batch is still running; retry later.
+    return {"batch_id": batch_id, "applied": applied}
+
 # ===== QUIZ ENDPOINTS =====
 
 @app.post("/api/quiz/generate-module")
@@ -30,13 +30,46 @@ CHROMA_COLLECTION_NAME = os.getenv("CHROMA_COLLECTION_NAME", "profai_documents")
 CHROMA_CLOUD_TENANT = os.getenv("CHROMA_CLOUD_TENANT")
 CHROMA_CLOUD_DATABASE = os.getenv("CHROMA_CLOUD_DATABASE")
 
+# Optional Redis cache (query-embedding cache); in-memory only when unset
+REDIS_URL = os.getenv("REDIS_URL")
+
 # --- LLM & RAG Settings ---
 LLM_MODEL_NAME = "gpt-5-mini"  # Keep for regular chat
 EMBEDDING_MODEL_NAME = "text-embedding-3-large"
 CURRICULUM_GENERATION_MODEL = "gpt-5"  # High TPM for course generation
 CONTENT_GENERATION_MODEL = "gpt-5"     # High TPM for content generation
 
+# Two-stage (Matryoshka) retrieval: coarse scan over truncated vectors in a
+# side collection, then rerank on the full vectors. Requires re-ingesting
+# documents after enabling so the side collection gets populated.
+USE_TWO_STAGE_RETRIEVAL = os.getenv("USE_TWO_STAGE_RETRIEVAL", "False").lower() == "true"
+MRL_COARSE_DIM = 256    # Dimensions kept for the coarse-scan vectors
+MRL_COARSE_K = 200      # Candidates fetched by the coarse scan before reranking
+
+# --- Local Embeddings (optional) ---
+# Requires sentence-transformers; trades some retrieval accuracy for local,
+# network-free ingestion-time embedding.
+USE_LOCAL_EMBEDDINGS = os.getenv("USE_LOCAL_EMBEDDINGS", "False").lower() == "true"
+LOCAL_EMBEDDING_MODEL_NAME = os.getenv("LOCAL_EMBEDDING_MODEL_NAME", "BAAI/bge-small-en-v1.5")
+
+# The cloud collection holds OpenAI-dimension vectors; a local 384-dim model
+# would silently insert unsearchable vectors into it. Fail at startup rather
+# than corrupt the shared collection.
+if USE_LOCAL_EMBEDDINGS and USE_CHROMA_CLOUD:
+    raise ValueError(
+        "USE_LOCAL_EMBEDDINGS requires USE_CHROMA_CLOUD=False: local embedding "
+        "dimensions do not match the OpenAI vectors in the cloud collection."
+    )
+
+# Store local FAISS vectors int8-quantized (~4x less RAM, slight recall cost)
+FAISS_INT8_QUANTIZATION = os.getenv("FAISS_INT8_QUANTIZATION", "False").lower() == "true"
+
+# --- Semantic Response Cache ---
+USE_SEMANTIC_CACHE = os.getenv("USE_SEMANTIC_CACHE", "True").lower() == "true"
+SEMANTIC_CACHE_THRESHOLD = 0.95  # Cosine similarity needed to reuse a cached answer
+
 # --- Text Processing ---
+PDF_SPLIT_PAGE_COUNT = 64  # PDFs above this many pages are extracted as parallel page ranges
 CHUNK_SIZE = 500
 CHUNK_OVERLAP = 100
 MAX_CHUNK_SIZE = 800
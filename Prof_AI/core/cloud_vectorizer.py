@@ -2,12 +2,38 @@
 Cloud Vectorizer - Handles connection to ChromaDB Cloud
 """
 
+import io
+import json
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from uuid import uuid4
+
 import chromadb
+import httpx
+import numpy as np
 from langchain_openai import OpenAIEmbeddings
 from langchain_community.vectorstores import Chroma
 
 import config
+from utils.batching_embedder import BatchingEmbedder
+from utils.embedding_cache import CachingEmbeddings
+
+# Texts per OpenAI embeddings request
+EMBED_BATCH_SIZE = 256
+# Concurrent embedding requests (kept modest to stay under OpenAI rate limits)
+MAX_EMBED_WORKERS = 8
+# Records per ChromaDB Cloud upsert (cloud limit is 300 per request)
+UPSERT_BATCH_SIZE = 200
+
+
+def _l2_normalize(vector):
+    """Returns the L2-normalized copy of a vector (list of floats)."""
+    norm = sum(v * v for v in vector) ** 0.5
+    if norm == 0:
+        return list(vector)
+    return [v / norm for v in vector]
 
 class CloudVectorizer:
     """Handles connection and operations with ChromaDB Cloud."""
@@ -23,10 +49,26 @@ class CloudVectorizer:
             database=config.CHROMA_CLOUD_DATABASE
         )
         self.embeddings = OpenAIEmbeddings(
-            model=config.EMBEDDING_MODEL_NAME, 
+            model=config.EMBEDDING_MODEL_NAME,
             openai_api_key=config.OPENAI_API_KEY,
-            chunk_size=200   # Process documents in batches of 200 to satisfy ChromaDB Cloud's limit of 300 per upsert
+            chunk_size=200,  # Process documents in batches of 200 to satisfy ChromaDB Cloud's limit of 300 per upsert
+            # Pooled clients reusing keep-alive connections across requests.
+            # Retrieval goes through the sync path (langchain's Chroma has no
+            # native async search, so queries run on executor threads); the
+            # async client covers direct aembed callers.
+            http_client=httpx.Client(
+                limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+                timeout=httpx.Timeout(30.0)
+            ),
+            http_async_client=httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+                timeout=httpx.Timeout(30.0)
+            )
         )
+        # One query-embed stack for every lookup path: repeated questions hit
+        # the content-hash cache, and concurrent misses coalesce into a
+        # single embed request.
+        self.query_embeddings = CachingEmbeddings(BatchingEmbedder(self.embeddings))
         logging.info("ChromaDB Cloud client initialized.")
 
     def get_vector_store(self):
@@ -35,15 +77,15 @@ class CloudVectorizer:
         This is used for querying (e.g., in ChatService).
         """
         try:
-            logging.info(f"Loading existing ChromaDB Cloud collection: {config.CHROMA_COLLECTION_NAME}")
+            logging.info("Loading existing ChromaDB Cloud collection: %s", config.CHROMA_COLLECTION_NAME)
             vector_store = Chroma(
                 client=self.client,
                 collection_name=config.CHROMA_COLLECTION_NAME,
-                embedding_function=self.embeddings,
+                embedding_function=self.query_embeddings,
             )
             return vector_store
         except Exception as e:
-            logging.error(f"Failed to load ChromaDB collection: {e}")
+            logging.error("Failed to load ChromaDB collection: %s", e)
             # This might happen if the collection doesn't exist yet.
             # It will be created when documents are added.
             return None
@@ -58,30 +100,217 @@ class CloudVectorizer:
             return None
         
         try:
-            logging.info(f"Creating/updating ChromaDB Cloud collection '{config.CHROMA_COLLECTION_NAME}' with {len(documents)} documents.")
-            
-            # Manual batching to respect ChromaDB Cloud's 300 record limit per upsert
-            batch_size = 200
-            vector_store = None
-            
-            for i in range(0, len(documents), batch_size):
-                batch = documents[i:i + batch_size]
-                logging.info(f"Processing batch {i//batch_size + 1}: {len(batch)} documents")
-                
-                if vector_store is None:
-                    # Create the initial vector store with the first batch
-                    vector_store = Chroma.from_documents(
-                        client=self.client,
-                        documents=batch,
-                        embedding=self.embeddings,
-                        collection_name=config.CHROMA_COLLECTION_NAME,
-                    )
-                else:
-                    # Add subsequent batches to the existing vector store
-                    vector_store.add_documents(batch)
-            
+            logging.info("Creating/updating ChromaDB Cloud collection '%s' with %d documents.", config.CHROMA_COLLECTION_NAME, len(documents))
+
+            texts = [doc.page_content for doc in documents]
+            metadatas = [doc.metadata for doc in documents]
+            ids = [uuid4().hex for _ in documents]
+
+            # Pre-embed in concurrent batches instead of letting Chroma.from_documents
+            # embed and insert one document at a time.
+            windows = [texts[i:i + EMBED_BATCH_SIZE] for i in range(0, len(texts), EMBED_BATCH_SIZE)]
+            logging.info("Embedding %d texts in %d batches of up to %d...", len(texts), len(windows), EMBED_BATCH_SIZE)
+            with ThreadPoolExecutor(max_workers=min(MAX_EMBED_WORKERS, len(windows))) as pool:
+                embedded_windows = list(pool.map(self.embeddings.embed_documents, windows))
+            embeddings = [vector for window in embedded_windows for vector in window]
+
+            # Push pre-computed vectors in batches that respect ChromaDB Cloud's
+            # 300 record limit per upsert.
+            collection = self.client.get_or_create_collection(config.CHROMA_COLLECTION_NAME)
+            for i in range(0, len(documents), UPSERT_BATCH_SIZE):
+                logging.info("Upserting batch %d: %d documents", i//UPSERT_BATCH_SIZE + 1, len(ids[i:i + UPSERT_BATCH_SIZE]))
+                collection.add(
+                    ids=ids[i:i + UPSERT_BATCH_SIZE],
+                    embeddings=embeddings[i:i + UPSERT_BATCH_SIZE],
+                    documents=texts[i:i + UPSERT_BATCH_SIZE],
+                    metadatas=metadatas[i:i + UPSERT_BATCH_SIZE],
+                )
+
+            # Keep a truncated-vector side collection in sync for the coarse
+            # pass of two-stage retrieval.
+            if config.USE_TWO_STAGE_RETRIEVAL:
+                self._add_to_short_collection(ids, embeddings)
+
+            vector_store = Chroma(
+                client=self.client,
+                collection_name=config.CHROMA_COLLECTION_NAME,
+                embedding_function=self.embeddings,
+            )
             logging.info("ChromaDB Cloud collection created/updated successfully.")
             return vector_store
         except Exception as e:
-            logging.error(f"Failed to create ChromaDB collection from documents: {e}")
-            raise
\ No newline at end of file
+            logging.error("Failed to create ChromaDB collection from documents: %s", e)
+            raise
+
+    def _batch_sidecar_path(self, batch_id: str) -> str:
+        return os.path.join(config.VECTORSTORE_DIR, f"embed_batch_{batch_id}.json")
+
+    def submit_embedding_batch(self, documents) -> str:
+        """
+        Submits the documents to the OpenAI Batch API for deferred embedding.
+
+        Bulk course ingestion doesn't need vectors within seconds, and the
+        Batch API prices embeddings at half the real-time rate without
+        competing against live query embeds for rate limit. Texts and
+        metadata are kept in a local sidecar file so apply_embedding_batch
+        can pair the returned vectors back up once the job completes.
+        Returns the batch id.
+        """
+        from openai import OpenAI
+
+        ids = [uuid4().hex for _ in documents]
+        lines = [
+            json.dumps({
+                "custom_id": doc_id,
+                "method": "POST",
+                "url": "/v1/embeddings",
+                "body": {"model": config.EMBEDDING_MODEL_NAME, "input": doc.page_content},
+            })
+            for doc_id, doc in zip(ids, documents)
+        ]
+
+        openai_client = OpenAI(api_key=config.OPENAI_API_KEY)
+        batch_file = openai_client.files.create(
+            file=io.BytesIO("\n".join(lines).encode("utf-8")),
+            purpose="batch",
+        )
+        batch = openai_client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/embeddings",
+            completion_window="24h",
+        )
+
+        sidecar = {
+            doc_id: {"document": doc.page_content, "metadata": doc.metadata}
+            for doc_id, doc in zip(ids, documents)
+        }
+        with open(self._batch_sidecar_path(batch.id), "w", encoding="utf-8") as f:
+            json.dump(sidecar, f)
+
+        logging.info("Submitted embedding batch %s with %d documents.", batch.id, len(documents))
+        return batch.id
+
+    def apply_embedding_batch(self, batch_id: str) -> bool:
+        """
+        Downloads a completed Batch API job and upserts its vectors.
+
+        Returns True when the batch was applied, False if it is still
+        running (callers can simply retry later).
+        """
+        from openai import OpenAI
+
+        openai_client = OpenAI(api_key=config.OPENAI_API_KEY)
+        batch = openai_client.batches.retrieve(batch_id)
+        if batch.status != "completed":
+            logging.info("Embedding batch %s not ready yet (status: %s).", batch_id, batch.status)
+            return False
+
+        sidecar_path = self._batch_sidecar_path(batch_id)
+        with open(sidecar_path, encoding="utf-8") as f:
+            sidecar = json.load(f)
+
+        output = openai_client.files.content(batch.output_file_id).text
+        ids, embeddings, texts, metadatas = [], [], [], []
+        for line in output.splitlines():
+            if not line:
+                continue
+            record = json.loads(line)
+            entry = sidecar.get(record["custom_id"])
+            if entry is None or record.get("error"):
+                logging.warning("Skipping batch record %s (missing or errored).", record.get("custom_id"))
+                continue
+            ids.append(record["custom_id"])
+            embeddings.append(record["response"]["body"]["data"][0]["embedding"])
+            texts.append(entry["document"])
+            metadatas.append(entry["metadata"])
+
+        collection = self.client.get_or_create_collection(config.CHROMA_COLLECTION_NAME)
+        for i in range(0, len(ids), UPSERT_BATCH_SIZE):
+            collection.add(
+                ids=ids[i:i + UPSERT_BATCH_SIZE],
+                embeddings=embeddings[i:i + UPSERT_BATCH_SIZE],
+                documents=texts[i:i + UPSERT_BATCH_SIZE],
+                metadatas=metadatas[i:i + UPSERT_BATCH_SIZE],
+            )
+        if config.USE_TWO_STAGE_RETRIEVAL:
+            self._add_to_short_collection(ids, embeddings)
+
+        os.remove(sidecar_path)
+        logging.info("Applied embedding batch %s: %d vectors upserted.", batch_id, len(ids))
+        return True
+
+    def _short_collection_name(self) -> str:
+        return f"{config.CHROMA_COLLECTION_NAME}_short"
+
+    def _add_to_short_collection(self, ids, embeddings):
+        """Stores L2-normalized, truncated copies of the given vectors."""
+        logging.info("Updating coarse collection '%s' with %d vectors.", self._short_collection_name(), len(ids))
+        short_collection = self.client.get_or_create_collection(self._short_collection_name())
+        short_vectors = [_l2_normalize(vec[:config.MRL_COARSE_DIM]) for vec in embeddings]
+        for i in range(0, len(ids), UPSERT_BATCH_SIZE):
+            short_collection.add(
+                ids=ids[i:i + UPSERT_BATCH_SIZE],
+                embeddings=short_vectors[i:i + UPSERT_BATCH_SIZE],
+            )
+
+    def retrieve(self, query: str, k: int = 8):
+        """
+        Two-stage retrieval: a coarse scan over the truncated-vector side
+        collection narrows the search to MRL_COARSE_K candidates, which are
+        then reranked by cosine similarity on their full vectors. The coarse
+        pass touches ~6x fewer bytes per distance computation than scanning
+        the full-dimension vectors directly.
+        """
+        from langchain_core.documents import Document
+
+        q_full = self.query_embeddings.embed_query(query)
+        q_short = _l2_normalize(q_full[:config.MRL_COARSE_DIM])
+
+        short_collection = self.client.get_collection(self._short_collection_name())
+        coarse = short_collection.query(
+            query_embeddings=[q_short],
+            n_results=config.MRL_COARSE_K,
+            include=[],
+        )
+        candidate_ids = coarse["ids"][0]
+        if not candidate_ids:
+            return []
+
+        full_collection = self.client.get_collection(config.CHROMA_COLLECTION_NAME)
+        result = full_collection.get(
+            ids=candidate_ids,
+            include=["embeddings", "documents", "metadatas"],
+        )
+
+        # Rerank with one vectorized matmul instead of a per-candidate Python
+        # loop over thousands of floats.
+        matrix = np.asarray(result["embeddings"], dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        matrix /= norms
+        q_vec = np.asarray(q_full, dtype=np.float32)
+        q_vec /= np.linalg.norm(q_vec) or 1.0
+        scores = matrix @ q_vec
+
+        top_k = min(k, len(scores))
+        # argpartition selects the top-k in O(n); only those get fully sorted.
+        top = np.argpartition(-scores, top_k - 1)[:top_k]
+        top = top[np.argsort(-scores[top])]
+
+        return [
+            Document(
+                page_content=result["documents"][i],
+                metadata=result["metadatas"][i] or {},
+            )
+            for i in top
+        ]
+
+
+@lru_cache(maxsize=1)
+def get_cloud_vectorizer() -> CloudVectorizer:
+    """
+    Returns a process-wide CloudVectorizer instance.
+    Every instantiation opens a fresh chromadb.CloudClient and OpenAIEmbeddings
+    (TLS pools, tokenizer load), so services should share one via this getter.
+    """
+    return CloudVectorizer()
\ No newline at end of file
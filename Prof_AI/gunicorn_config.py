@@ -15,7 +15,50 @@ bind = "0.0.0.0:5001"
 # Number of worker processes (a good starting point is 2 * num_cores + 1)
 workers = 4
 
+# Import the app once in the master and share bytecode, config and the
+# embeddings tokenizer with workers via copy-on-write, instead of paying the
+# full import (and its RAM) once per worker.
+preload_app = True
+
 # Logging configuration
 accesslog = "-"  # Log access to stdout
 errorlog = "-"   # Log errors to stdout
 loglevel = "info"
+
+
+def post_fork(server, worker):
+    """
+    Rebuild the app-level services after fork. With preload_app, app.py
+    constructs ChatService/AudioService (and their Chroma Cloud, Sarvam and
+    OpenAI connections) at import time in the master, and every worker
+    inherits those live sockets; clearing only the memoized getters would
+    leave the services' existing references untouched. app.rebuild_services
+    clears the client caches and reconstructs the services so each worker
+    serves through connections it opened itself.
+    """
+    try:
+        import app
+        app.rebuild_services()
+    except Exception as e:
+        worker.log.warning("Post-fork service rebuild failed: %s" % e)
+
+
+def post_worker_init(worker):
+    """
+    Warm per-worker lazy state right after fork, so the tokenizer load and the
+    first Chroma connection are paid at startup instead of on the first user
+    request served by each worker.
+    """
+    try:
+        import tiktoken
+        tiktoken.get_encoding("cl100k_base")
+
+        # Warm the store the request path actually serves from — the one
+        # held by the rebuilt chat service — not a standalone vectorizer.
+        import app
+        if app.chat_service is not None and app.chat_service.vector_store is not None:
+            app.chat_service.vector_store.similarity_search("warmup", k=1)
+        worker.log.info("Worker warmup complete")
+    except Exception as e:
+        # Warmup is best-effort; a failure just means the first request pays it.
+        worker.log.warning("Worker warmup failed: %s" % e)
@@ -24,18 +24,27 @@ class TextChunker:
         """
         logging.info(f"Starting to chunk {len(documents)} documents...")
         all_chunks = []
-        
+
+        # Hoist the hot lookups out of the loop and build each document's
+        # chunks in one extend; on large corpora the per-chunk attribute and
+        # append overhead adds up.
+        split_text = self.text_splitter.split_text
+        extend = all_chunks.extend
         for doc in documents:
-            chunks = self.text_splitter.split_text(doc['content'])
-            for i, chunk in enumerate(chunks):
-                all_chunks.append(Document(
-                    page_content=chunk, 
+            chunks = split_text(doc['content'])
+            source = doc['source']
+            total_chunks = len(chunks)
+            extend(
+                Document(
+                    page_content=chunk,
                     metadata={
-                        "source": doc['source'],
+                        "source": source,
                         "chunk_id": i,
-                        "total_chunks": len(chunks)
-                    }
-                ))
-        
+                        "total_chunks": total_chunks,
+                    },
+                )
+                for i, chunk in enumerate(chunks)
+            )
+
         logging.info(f"Successfully created {len(all_chunks)} chunks")
         return all_chunks
\ No newline at end of file
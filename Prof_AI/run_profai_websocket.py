@@ -4,8 +4,9 @@ ProfAI WebSocket Server Startup Script
 Starts both the FastAPI server and WebSocket server for optimal performance
 """
 
+import argparse
 import asyncio
-import threading
+import multiprocessing
 import time
 import sys
 import os
@@ -22,20 +23,27 @@ modules_to_clear = [mod for mod in sys.modules if 'sarvam' in mod.lower()]
 for mod in modules_to_clear:
     del sys.modules[mod]
 
+# Worker count matches gunicorn_config.py (2 * num_cores + 1 guideline)
+FASTAPI_WORKERS = int(os.getenv("FASTAPI_WORKERS", 4))
+
 def start_fastapi_server(host, port):
-    """Start FastAPI server in a separate thread with proper async handling."""
+    """Start multi-worker Uvicorn for the FastAPI app (runs in its own process)."""
     try:
         import uvicorn
-        from app import app
-        
-        print(f"🚀 Starting FastAPI server on http://{host}:{port}")
-        # Create completely isolated event loop for FastAPI thread
-        import asyncio
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        
-        # Run without loop parameter to avoid ProactorEventLoop error
-        uvicorn.run(app, host=host, port=port, log_level="warning")
+
+        print(f"🚀 Starting FastAPI server on http://{host}:{port} ({FASTAPI_WORKERS} workers)")
+        # Run uvicorn's own worker manager in-process instead of wrapping the
+        # app in an extra supervisor layer. httptools gives C-parsed HTTP;
+        # loop="auto" picks uvloop where it is installed.
+        uvicorn.run(
+            "app:app",
+            host=host,
+            port=port,
+            workers=FASTAPI_WORKERS,
+            http="httptools",
+            loop="auto",
+            log_level="warning",
+        )
     except Exception as e:
         print(f"❌ FastAPI startup error: {e}")
         import traceback
@@ -50,6 +58,15 @@ async def start_websocket_server_async(host, port):
 
 def main():
     """Main startup function."""
+    parser = argparse.ArgumentParser(description="ProfAI server launcher")
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Start even if the target ports appear to be in use",
+    )
+    args, _ = parser.parse_known_args()
+    force = args.force or bool(os.getenv("PROFAI_FORCE"))
+
     fastapi_host = os.getenv("HOST", "0.0.0.0")
     fastapi_port = int(os.getenv("PORT", 5001))
     websocket_host = os.getenv("WEBSOCKET_HOST", "0.0.0.0")
@@ -59,31 +76,53 @@ def main():
     print("🎓 ProfAI - High Performance Server")
     print("=" * 60)
 
+    fastapi_process = None
     try:
         import socket
-        import subprocess
 
-        def check_port(host, port, name):
+        async def check_port_async(host, port, name):
             sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            result = sock.connect_ex((host, port))
-            sock.close()
+            # Hard bound on the probe; the OS default connect timeout can
+            # stall startup for seconds on unreachable hosts.
+            sock.settimeout(0.2)
+            loop = asyncio.get_running_loop()
+            try:
+                result = await loop.run_in_executor(None, sock.connect_ex, (host, port))
+            finally:
+                sock.close()
             if result == 0:
                 print(f"⚠️  Warning: Port {port} ({name}) appears to be in use.")
                 return False
             return True
 
-        if not check_port(fastapi_host, fastapi_port, "FastAPI") or not check_port(websocket_host, websocket_port, "WebSocket"):
-            if input("\nContinue anyway? (y/N): ").lower().strip() != 'y':
-                sys.exit(1)
+        async def check_ports():
+            # Probe both ports concurrently instead of back to back
+            return await asyncio.gather(
+                check_port_async(fastapi_host, fastapi_port, "FastAPI"),
+                check_port_async(websocket_host, websocket_port, "WebSocket"),
+            )
 
-        # Start FastAPI server using threading (fallback method)
+        fastapi_available, websocket_available = asyncio.run(check_ports())
+
+        if not (fastapi_available and websocket_available):
+            # No interactive prompt here: a stdin read would hang container
+            # startup forever under an orchestrator. Fail fast so the
+            # scheduler can restart us, unless --force / PROFAI_FORCE says
+            # to proceed regardless.
+            if not force:
+                print("❌ Required port(s) in use. Re-run with --force (or PROFAI_FORCE=1) to start anyway.")
+                sys.exit(2)
+            print("⚠️  Ports in use but --force given; continuing.")
+
+        # Start FastAPI server in its own process so uvicorn's worker manager
+        # owns the main thread there (not daemonic: it forks worker children).
         print("\n🚀 Starting FastAPI server...")
-        fastapi_thread = threading.Thread(target=start_fastapi_server, args=(fastapi_host, fastapi_port), daemon=True)
-        fastapi_thread.start()
-        
+        fastapi_process = multiprocessing.Process(target=start_fastapi_server, args=(fastapi_host, fastapi_port))
+        fastapi_process.start()
+
         # Give FastAPI time to start
         print("Waiting for FastAPI server to initialize...")
-        time.sleep(10) 
+        time.sleep(10)
         
         print("\n" + "=" * 60)
         print("✅ FastAPI server is running.")
@@ -102,6 +141,10 @@ def main():
         import traceback
         traceback.print_exc()
         sys.exit(1)
+    finally:
+        if fastapi_process is not None and fastapi_process.is_alive():
+            fastapi_process.terminate()
+            fastapi_process.join(timeout=5)
 
 if __name__ == "__main__":
     main()
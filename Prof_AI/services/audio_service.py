@@ -5,23 +5,26 @@ Audio Service - Handles audio transcription and generation
 import io
 from typing import Optional
 import config
-from services.sarvam_service import SarvamService
+from services.sarvam_service import get_sarvam_service
 from utils.connection_monitor import is_client_connected, is_normal_closure
 
+# Resolved once at import instead of indexing config.SUPPORTED_LANGUAGES per call
+_DEFAULT_LANGUAGE_CODE = config.SUPPORTED_LANGUAGES[0]["code"]
+
 class AudioService:
     """Service for audio processing operations."""
-    
+
     def __init__(self):
-        self.sarvam_service = SarvamService()
+        self.sarvam_service = get_sarvam_service()
     
     async def transcribe_audio(self, audio_file_buffer: io.BytesIO, language: Optional[str] = None) -> str:
         """Transcribe audio to text."""
-        effective_language = language or config.SUPPORTED_LANGUAGES[0]['code']
+        effective_language = language or _DEFAULT_LANGUAGE_CODE
         return await self.sarvam_service.transcribe_audio(audio_file_buffer, effective_language)
     
     async def generate_audio_from_text(self, text: str, language: Optional[str] = None, ultra_fast: bool = False) -> io.BytesIO:
         """Generate audio from text with speed options."""
-        effective_language = language or config.SUPPORTED_LANGUAGES[0]['code']
+        effective_language = language or _DEFAULT_LANGUAGE_CODE
         
         if ultra_fast:
             return await self.sarvam_service.generate_audio_ultra_fast(
@@ -38,7 +41,7 @@ class AudioService:
     
     async def stream_audio_from_text(self, text: str, language: Optional[str] = None, websocket=None):
         """Stream audio chunks as they're generated for real-time playback."""
-        effective_language = language or config.SUPPORTED_LANGUAGES[0]['code']
+        effective_language = language or _DEFAULT_LANGUAGE_CODE
         
         try:
             async for audio_chunk in self.sarvam_service.stream_audio_generation(
@@ -50,16 +53,16 @@ class AudioService:
                 if audio_chunk and len(audio_chunk) > 0:
                     yield audio_chunk
         except Exception as e:
-            error_msg = str(e)
-            # Check if this is a normal disconnection
-            if self._is_normal_disconnection(error_msg):
+            # connection_monitor inspects the exception class and close code
+            # first, so a clean close never triggers the error fallback.
+            if is_normal_closure(e):
                 print(f"🔌 Client disconnected during audio streaming: {e}")
                 print(f"⚠️ Stopping audio streaming - client no longer connected")
                 return
             else:
                 print(f"❌ Error in audio streaming: {e}")
                 # Only fallback for actual errors, not disconnections
-                if not websocket or not self._is_client_disconnected(websocket):
+                if not websocket or is_client_connected(websocket):
                     try:
                         audio_buffer = await self.generate_audio_from_text(text, language, ultra_fast=True)
                         if audio_buffer and audio_buffer.getbuffer().nbytes > 0:
@@ -70,48 +73,3 @@ class AudioService:
                         # Return empty generator
                         return
     
-    def _is_client_disconnected(self, websocket) -> bool:
-        """Check if WebSocket client is disconnected."""
-        try:
-            if not websocket:
-                return False
-            
-            # Check if WebSocket is closed or closing
-            if hasattr(websocket, 'closed') and websocket.closed:
-                return True
-            
-            if hasattr(websocket, 'state'):
-                # WebSocket states: CONNECTING=0, OPEN=1, CLOSING=2, CLOSED=3
-                return websocket.state in [2, 3]  # CLOSING or CLOSED
-            
-            return False
-        except Exception:
-            # If we can't check the state, assume disconnected for safety
-            return True
-    
-    def _is_normal_disconnection(self, error_msg: str) -> bool:
-        """Check if error message indicates a normal client disconnection."""
-        if not error_msg:
-            return False
-        
-        error_msg = str(error_msg).lower()
-        
-        # Check for normal WebSocket closure codes
-        normal_codes = ["1000", "1001"]  # OK, Going Away
-        for code in normal_codes:
-            if code in error_msg:
-                return True
-        
-        # Check for common disconnection phrases
-        disconnection_phrases = [
-            "connection closed",
-            "client disconnected", 
-            "going away",
-            "connection lost"
-        ]
-        
-        for phrase in disconnection_phrases:
-            if phrase in error_msg:
-                return True
-        
-        return False
\ No newline at end of file
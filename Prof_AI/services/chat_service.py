@@ -2,22 +2,46 @@
 Chat Service - Handles RAG-based conversations and multilingual support
 """
 
+import asyncio
 import time
 import logging
+from contextlib import contextmanager
 from typing import Dict, Any
 import config
 from services.document_service import DocumentProcessor
 from services.rag_service import RAGService
 from services.llm_service import LLMService
-from services.sarvam_service import SarvamService
+from services.sarvam_service import get_sarvam_service
 from utils.response_validator import ResponseValidator
 
+# Code -> display-name lookup built once at import; ask_question previously
+# scanned config.SUPPORTED_LANGUAGES linearly on every call.
+_LANG_BY_CODE = {lang["code"]: lang["name"] for lang in config.SUPPORTED_LANGUAGES}
+
+def _looks_like_english(text: str) -> bool:
+    """
+    Cheap guard against mislabeled locales: every supported non-English
+    language is written in a non-ASCII script, so a pure-ASCII query tagged
+    e.g. 'hi-IN' is almost certainly English and doesn't need a Sarvam
+    translation round-trip.
+    """
+    return text.isascii()
+
+@contextmanager
+def _timed(label: str):
+    """Logs how long the wrapped block took, using a monotonic clock."""
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        logging.info("  > %s in %.2fs.", label, time.perf_counter() - t0)
+
 class ChatService:
     """Main chat service that coordinates RAG, translation, and LLM services."""
     
     def __init__(self):
         self.llm_service = LLMService()
-        self.sarvam_service = SarvamService()
+        self.sarvam_service = get_sarvam_service()
         self.document_processor = DocumentProcessor()
         self.validator = ResponseValidator()
         self.vector_store = self._initialize_vector_store()
@@ -35,100 +59,173 @@ class ChatService:
         """Initializes the vector store from ChromaDB Cloud or local FAISS."""
         try:
             if config.USE_CHROMA_CLOUD:
-                from core.cloud_vectorizer import CloudVectorizer
+                from core.cloud_vectorizer import get_cloud_vectorizer
                 logging.info("Attempting to load vector store from ChromaDB Cloud...")
-                cloud_vectorizer = CloudVectorizer()
-                return cloud_vectorizer.get_vector_store()
+                return get_cloud_vectorizer().get_vector_store()
             else:
                 logging.info("Attempting to load vector store from local FAISS...")
                 return self.document_processor.get_vectorstore()
         except Exception as e:
-            logging.error(f"Failed to initialize vector store: {e}")
+            logging.error("Failed to initialize vector store: %s", e)
             return None
 
     async def ask_question(self, query: str, query_language_code: str = "en-IN") -> Dict[str, Any]:
         """Answer a question using RAG with multilingual support."""
         
-        response_lang_name = next(
-            (lang["name"] for lang in config.SUPPORTED_LANGUAGES if lang["code"] == query_language_code), 
-            "English"
-        )
+        response_lang_name = _LANG_BY_CODE.get(query_language_code, "English")
 
         if self.is_rag_active:
             # Translate query to English if needed
-            start_time = time.time()
             english_query = query
-            if query_language_code != "en-IN":
+            if query_language_code != "en-IN" and _looks_like_english(query):
+                logging.info("  > Query tagged %s but is ASCII-only; skipping translation.", query_language_code)
+            elif query_language_code != "en-IN":
                 logging.info("[TASK] Translating query to English using Sarvam AI...")
-                english_query = await self.sarvam_service.translate_text(
-                    text=query,
-                    source_language_code=query_language_code,
-                    target_language_code="en-IN"
-                )
-                end_time = time.time()
-                logging.info(f"  > Translation complete in {end_time - start_time:.2f}s. (Query: '{english_query}')")
+                with _timed("Translation complete"):
+                    english_query = await self.sarvam_service.translate_text(
+                        text=query,
+                        source_language_code=query_language_code,
+                        target_language_code="en-IN"
+                    )
+                logging.info("  > Translated query: '%s'", english_query)
             
+            fallback_task = None
             try:
-                # Execute RAG chain
+                # Execute RAG chain, with the general-knowledge fallback started
+                # speculatively alongside it: a RAG miss then reuses the
+                # in-flight fallback instead of paying a second serial LLM call.
                 logging.info("[TASK] Executing RAG chain...")
-                start_time = time.time()
-                answer = await self.rag_service.get_answer(english_query, response_lang_name)
-                end_time = time.time()
-                logging.info(f"  > RAG chain complete in {end_time - start_time:.2f}s.")
-                
+                rag_task = asyncio.create_task(
+                    self.rag_service.get_answer(english_query, response_lang_name)
+                )
+                fallback_task = asyncio.create_task(
+                    self.llm_service.get_general_response(query, response_lang_name)
+                )
+                with _timed("RAG chain complete"):
+                    result = await rag_task
+
                 # Validate and sanitize the response
                 answer = self.validator.validate_and_sanitize(
-                    answer,
+                    result.answer,
                     fallback_message="I apologize, but I encountered an issue generating a proper response. Please try asking your question again."
                 )
-                
+
                 # Check if RAG found an answer
-                if "I cannot find the answer" in answer:
-                    logging.info("  > RAG chain failed. Falling back to general LLM...")
-                    start_time = time.time()
-                    answer = await self.llm_service.get_general_response(query, response_lang_name)
+                if result.no_answer:
+                    logging.info("  > RAG chain failed. Using speculative general LLM fallback...")
+                    with _timed("Fallback complete"):
+                        answer = await fallback_task
                     answer = self.validator.validate_and_sanitize(answer)
-                    end_time = time.time()
-                    logging.info(f"  > Fallback complete in {end_time - start_time:.2f}s.")
                     return {"answer": answer, "sources": ["General Knowledge Fallback"]}
 
+                fallback_task.cancel()
                 return {"answer": answer, "sources": ["Course Content"]}
 
             except Exception as e:
-                logging.error(f"  > Error during RAG chain invocation: {e}. Falling back...")
+                logging.error("  > Error during RAG chain invocation: %s. Falling back...", e)
+                if fallback_task is not None and not fallback_task.cancelled():
+                    # The speculative fallback is already in flight; finish it
+                    # rather than issuing a fresh call below.
+                    answer = self.validator.validate_and_sanitize(await fallback_task)
+                    return {"answer": answer, "sources": ["General Knowledge"]}
         
         # Fallback to general knowledge
         logging.info("[TASK] Using general knowledge fallback...")
-        start_time = time.time()
-        answer = await self.llm_service.get_general_response(query, response_lang_name)
+        with _timed("General knowledge fallback complete"):
+            answer = await self.llm_service.get_general_response(query, response_lang_name)
         answer = self.validator.validate_and_sanitize(answer)
-        end_time = time.time()
-        logging.info(f"  > General knowledge fallback complete in {end_time - start_time:.2f}s.")
         return {"answer": answer, "sources": ["General Knowledge"]}
     
-    def update_with_course_content(self, course_data: dict):
-        """Update the RAG system with new course content."""
+    # Matches ChromaDB Cloud's 300-record upsert limit
+    _ADD_BATCH_SIZE = 200
+    _MAX_ADD_WORKERS = 4
+
+    def _add_documents_batched(self, documents):
+        """Add documents to the vector store in batches instead of one bulk call."""
+        if config.USE_CHROMA_CLOUD:
+            self._add_documents_cloud(documents)
+            return
+        # Local FAISS is not safe for concurrent writes; add sequentially.
+        for i in range(0, len(documents), self._ADD_BATCH_SIZE):
+            self.vector_store.add_documents(documents[i:i + self._ADD_BATCH_SIZE])
+
+    def _add_documents_cloud(self, documents):
+        """
+        Embed all chunks in one pass through the shared embedding client,
+        then hand Chroma Cloud the finished vectors so each insert is
+        storage-only (add_documents would re-embed batch by batch inside the
+        insert path). Insert batches go up concurrently, sized to the
+        cloud's 300-records-per-upsert limit.
+        """
+        from uuid import uuid4
+
+        texts = [doc.page_content for doc in documents]
+        metadatas = [doc.metadata for doc in documents]
+        ids = [uuid4().hex for _ in documents]
+        vectors = self.document_processor.embeddings.embed_documents(texts)
+        collection = self.vector_store._collection
+
+        def add_slice(start):
+            stop = start + self._ADD_BATCH_SIZE
+            collection.add(
+                ids=ids[start:stop],
+                embeddings=vectors[start:stop],
+                documents=texts[start:stop],
+                metadatas=metadatas[start:stop],
+            )
+
+        starts = range(0, len(documents), self._ADD_BATCH_SIZE)
+        if len(starts) > 1:
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=min(self._MAX_ADD_WORKERS, len(starts))) as pool:
+                list(pool.map(add_slice, starts))
+        else:
+            for start in starts:
+                add_slice(start)
+
+        # Keep the coarse side collection in sync so two-stage retrieval can
+        # see content added after initial ingestion.
+        if config.USE_TWO_STAGE_RETRIEVAL:
+            from core.cloud_vectorizer import get_cloud_vectorizer
+            get_cloud_vectorizer()._add_to_short_collection(ids, vectors)
+
+    def update_with_course_content(self, course_data: dict, defer: bool = False):
+        """
+        Update the RAG system with new course content.
+
+        With defer=True (ChromaDB Cloud only) the chunks are submitted to the
+        OpenAI Batch API instead of being embedded inline — half the embedding
+        cost and no rate-limit contention with live queries, at the price of
+        the content becoming searchable only once the batch is applied.
+        Returns the batch id when deferring, otherwise None.
+        """
         try:
             # Extract course documents
             course_documents = self.document_processor.extract_course_documents(course_data)
-            
+
             if course_documents:
                 # Split documents
                 split_course_docs = self.document_processor.split_documents(course_documents)
-                
+
+                if defer and config.USE_CHROMA_CLOUD:
+                    from core.cloud_vectorizer import get_cloud_vectorizer
+                    batch_id = get_cloud_vectorizer().submit_embedding_batch(split_course_docs)
+                    logging.info("✅ Deferred %d course content chunks to embedding batch %s", len(split_course_docs), batch_id)
+                    return batch_id
+
                 # Add to vectorstore
                 if self.vector_store:
-                    self.vector_store.add_documents(split_course_docs)
+                    self._add_documents_batched(split_course_docs)
                 else:
                     # This case is unlikely if initialization is correct, but handled for safety
                     self.vector_store = self._initialize_vector_store()
                     if self.vector_store:
-                        self.vector_store.add_documents(split_course_docs)
+                        self._add_documents_batched(split_course_docs)
                         self.rag_service = RAGService(self.vector_store)
                         self.is_rag_active = True
                 
-                logging.info(f"✅ Added {len(split_course_docs)} course content chunks to RAG system")
+                logging.info("✅ Added %d course content chunks to RAG system", len(split_course_docs))
                 
         except Exception as e:
-            logging.error(f"⚠️ Error updating RAG with course content: {e}")
+            logging.error("⚠️ Error updating RAG with course content: %s", e)
             raise e
\ No newline at end of file
@@ -6,6 +6,7 @@ import os
 import shutil
 import json
 import logging
+import orjson
 from typing import List
 from fastapi import UploadFile
 from langchain_core.documents import Document
@@ -14,6 +15,36 @@ from langchain_openai import OpenAIEmbeddings
 from langchain_community.vectorstores import Chroma
 
 import config
+from functools import lru_cache
+
+
+# Memoized constructors for the heavy pipeline components. The in-function
+# imports keep app cold-start fast, but rebuilding a CourseGenerator (two
+# ChatOpenAI clients) or Vectorizer per upload threw connections and parser
+# setup away between requests; each is now constructed once per process.
+@lru_cache(maxsize=1)
+def _get_pdf_extractor():
+    from processors.pdf_extractor import PDFExtractor
+    return PDFExtractor()
+
+
+@lru_cache(maxsize=1)
+def _get_text_chunker():
+    from processors.text_chunker import TextChunker
+    return TextChunker(chunk_size=config.CHUNK_SIZE, chunk_overlap=config.CHUNK_OVERLAP)
+
+
+@lru_cache(maxsize=1)
+def _get_vectorizer():
+    from core.vectorizer import Vectorizer
+    return Vectorizer(embedding_model=config.EMBEDDING_MODEL_NAME, api_key=config.OPENAI_API_KEY)
+
+
+@lru_cache(maxsize=1)
+def _get_course_generator():
+    from core.course_generator import CourseGenerator
+    return CourseGenerator()
+
 
 class DocumentService:
     """Service for processing documents and generating courses."""
@@ -40,25 +71,23 @@ class DocumentService:
                 
                 file_path = os.path.join(config.DOCUMENTS_DIR, pdf_file.filename)
                 with open(file_path, "wb") as buffer:
-                    shutil.copyfileobj(pdf_file.file, buffer)
+                    # 1 MiB copy buffer: large PDFs move in a handful of
+                    # read/write syscalls instead of the 16 KiB default
+                    shutil.copyfileobj(pdf_file.file, buffer, length=1 << 20)
                 saved_files.append(file_path)
                 logging.info(f"Saved uploaded PDF: {pdf_file.filename}")
             
-            # Import processing modules
-            from core.course_generator import CourseGenerator
-            from processors.pdf_extractor import PDFExtractor
-            from processors.text_chunker import TextChunker
-            from core.vectorizer import Vectorizer
-            
             # Process documents
             logging.info("STEP 1: Extracting text from PDFs...")
-            extractor = PDFExtractor()
-            raw_docs = extractor.extract_text_from_directory(config.DOCUMENTS_DIR)
+            extractor = _get_pdf_extractor()
+            # The saved paths are known, so extraction can fan out across
+            # processes instead of walking the directory serially.
+            raw_docs = extractor.extract_text_from_files(saved_files)
             if not raw_docs:
                 raise Exception("No text could be extracted from uploaded documents")
 
             logging.info("STEP 2: Chunking documents...")
-            chunker = TextChunker(chunk_size=config.CHUNK_SIZE, chunk_overlap=config.CHUNK_OVERLAP)
+            chunker = _get_text_chunker()
             doc_chunks = chunker.chunk_documents(raw_docs)
             if not doc_chunks:
                 raise Exception("No chunks could be created from documents")
@@ -66,13 +95,12 @@ class DocumentService:
             logging.info("STEP 3: Creating vector store...")
             vector_store = None
             if config.USE_CHROMA_CLOUD:
-                from core.cloud_vectorizer import CloudVectorizer
+                from core.cloud_vectorizer import get_cloud_vectorizer
                 logging.info("Using ChromaDB Cloud for vector store.")
-                cloud_vectorizer = CloudVectorizer()
-                vector_store = cloud_vectorizer.create_vector_store_from_documents(doc_chunks)
+                vector_store = get_cloud_vectorizer().create_vector_store_from_documents(doc_chunks)
             else:
                 logging.info("Using local FAISS for vector store.")
-                vectorizer = Vectorizer(embedding_model=config.EMBEDDING_MODEL_NAME, api_key=config.OPENAI_API_KEY)
+                vectorizer = _get_vectorizer()
                 self._safe_cleanup_vectorstore()
                 vector_store = vectorizer.create_vector_store(doc_chunks)
                 if vector_store:
@@ -82,7 +110,7 @@ class DocumentService:
                 raise Exception("Vector store could not be created")
 
             logging.info("STEP 4: Generating course...")
-            course_generator = CourseGenerator()
+            course_generator = _get_course_generator()
             
             # Get the primary PDF filename for source filtering
             primary_pdf_filename = None
@@ -193,8 +221,8 @@ class DocumentService:
         
         if os.path.exists(config.OUTPUT_JSON_PATH):
             try:
-                with open(config.OUTPUT_JSON_PATH, 'r', encoding='utf-8') as f:
-                    existing_data = json.load(f)
+                with open(config.OUTPUT_JSON_PATH, 'rb') as f:
+                    existing_data = orjson.loads(f.read())
                 
                 # Handle both single course and multi-course formats
                 if isinstance(existing_data, dict) and 'course_title' in existing_data:
@@ -219,16 +247,14 @@ class DocumentService:
     
     def _get_next_course_id(self, existing_courses):
         """Get the next available course ID."""
-        if not existing_courses:
-            return 1
-        
-        # Find the maximum course ID
-        max_id = 0
-        for course in existing_courses:
-            course_id = course.get('course_id', 0)
-            if isinstance(course_id, int) and course_id > max_id:
-                max_id = course_id
-        
+        max_id = max(
+            (
+                course_id
+                for course in existing_courses
+                if isinstance(course_id := course.get('course_id', 0), int)
+            ),
+            default=0,
+        )
         return max_id + 1
     
     def _ensure_unique_title(self, course_dict, existing_courses):
@@ -237,9 +263,9 @@ class DocumentService:
         title = original_title
         counter = 1
         
-        # Check if title already exists
-        existing_titles = [course.get('course_title', '') for course in existing_courses]
-        
+        # Set membership keeps each collision check O(1) as the DB grows
+        existing_titles = {course.get('course_title', '') for course in existing_courses}
+
         while title in existing_titles:
             counter += 1
             title = f"{original_title} ({counter})"
@@ -268,10 +294,14 @@ class DocumentService:
                 if 'modules' not in course:
                     raise ValueError(f"Course {i} missing modules")
             
-            # Always save as array format for consistency
-            with open(config.OUTPUT_JSON_PATH, 'w', encoding='utf-8') as f:
-                json.dump(courses, f, indent=4, ensure_ascii=False)
-            
+            # Always save as array format for consistency. orjson serializes
+            # the nested course dicts in C, and writing to a temp file then
+            # os.replace keeps the file valid if the process dies mid-write.
+            tmp_path = config.OUTPUT_JSON_PATH + ".tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(orjson.dumps(courses, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            os.replace(tmp_path, config.OUTPUT_JSON_PATH)
+
             logging.info(f"Successfully saved {len(courses)} courses to {config.OUTPUT_JSON_PATH}")
             
         except Exception as e:
@@ -348,23 +378,26 @@ class DocumentProcessor:
     """Helper class for document processing operations."""
     
     def __init__(self):
-        self.embeddings = OpenAIEmbeddings(
-            model=config.EMBEDDING_MODEL_NAME, 
-            openai_api_key=config.OPENAI_API_KEY,
-            chunk_size=200   # Process documents in batches of 200 to satisfy ChromaDB Cloud's limit of 300 per upsert
-        )
+        # Shared pooled client; see utils.openai_clients
+        from utils.openai_clients import get_embeddings
+        self.embeddings = get_embeddings()
     
     def get_vectorstore(self, recreate: bool = False, documents: List[Document] = None):
         """Get or create vectorstore using FAISS (more reliable on Windows)."""
         from langchain_community.vectorstores import FAISS
-        
+        from langchain_community.vectorstores.utils import DistanceStrategy
+
         if recreate:
             # Use FAISS instead of Chroma to avoid Windows file locking issues
             if not documents:
                 raise ValueError("Documents must be provided when recreating vectorstore")
+            # Inner product over L2-normalized vectors: exact cosine search
+            # on a flat index, cheaper per query than L2 at these corpus sizes
             return FAISS.from_documents(
                 documents=documents,
-                embedding=self.embeddings
+                embedding=self.embeddings,
+                normalize_L2=True,
+                distance_strategy=DistanceStrategy.MAX_INNER_PRODUCT
             )
         else:
             # Try to load existing FAISS vectorstore
@@ -383,9 +416,12 @@ class DocumentProcessor:
     def create_vectorstore_from_documents(self, documents: List[Document]):
         """Create a new vectorstore from documents using FAISS."""
         from langchain_community.vectorstores import FAISS
+        from langchain_community.vectorstores.utils import DistanceStrategy
         return FAISS.from_documents(
             documents=documents,
-            embedding=self.embeddings
+            embedding=self.embeddings,
+            normalize_L2=True,
+            distance_strategy=DistanceStrategy.MAX_INNER_PRODUCT
         )
     
     def split_documents(self, documents: List[Document]) -> List[Document]:
@@ -2,8 +2,9 @@
 LLM Service - Handles OpenAI language model interactions with streaming support
 """
 
+import asyncio
 from openai import AsyncOpenAI
-from typing import AsyncGenerator
+from typing import AsyncGenerator, List
 import config
 
 class LLMService:
@@ -14,9 +15,39 @@ class LLMService:
             api_key=config.OPENAI_API_KEY,
             timeout=60.0  # 8 second timeout for all requests
         )
-    
+        self.semantic_cache = None
+        if config.USE_SEMANTIC_CACHE:
+            try:
+                from utils.semantic_cache import SemanticCache
+                self.semantic_cache = SemanticCache()
+            except Exception as e:
+                print(f"Semantic cache unavailable, continuing without it: {e}")
+
+    async def _embed_for_cache(self, text: str):
+        """Embed a cache key; returns None (cache skipped) on any failure."""
+        if self.semantic_cache is None:
+            return None
+        try:
+            response = await self.client.embeddings.create(
+                model=config.EMBEDDING_MODEL_NAME,
+                input=[text]
+            )
+            return response.data[0].embedding
+        except Exception as e:
+            print(f"Semantic cache embed failed: {e}")
+            return None
+
+
     async def get_general_response(self, query: str, target_language: str = "English") -> str:
         """Get a general response from the LLM."""
+        # The language is part of the cache key so a Hindi answer is never
+        # served for the same question asked in English.
+        cache_vector = await self._embed_for_cache(f"{target_language}: {query}")
+        if cache_vector is not None:
+            cached = self.semantic_cache.get(cache_vector)
+            if cached is not None:
+                return cached
+
         messages = [
             {
                 "role": "system", 
@@ -37,13 +68,19 @@ IMPORTANT QUALITY GUIDELINES:
         try:
             response = await self.client.chat.completions.create(
                 model=config.LLM_MODEL_NAME, 
-                messages=messages, 
+                messages=messages,
                 temperature=1
             )
-            return response.choices[0].message.content
+            answer = response.choices[0].message.content
         except Exception as e:
             print(f"Error getting general LLM response: {e}")
             return "I am sorry, I couldn't process that request at the moment."
+
+        # Cache outside the completion try-block: a failed insert must not
+        # discard an answer that was already generated.
+        if cache_vector is not None:
+            self.semantic_cache.put(cache_vector, answer)
+        return answer
     
     async def translate_text(self, text: str, target_language: str) -> str:
         """Translate text using the LLM."""
@@ -77,6 +114,12 @@ QUALITY REQUIREMENTS:
     
     async def generate_response(self, prompt: str, temperature: float = 0.7) -> str:
         """Generate a response from the LLM."""
+        cache_vector = await self._embed_for_cache(prompt)
+        if cache_vector is not None:
+            cached = self.semantic_cache.get(cache_vector)
+            if cached is not None:
+                return cached
+
         messages = [
             {
                 "role": "system",
@@ -97,11 +140,39 @@ QUALITY REQUIREMENTS:
                 messages=messages,
                 temperature=temperature
             )
-            return response.choices[0].message.content
+            answer = response.choices[0].message.content
         except Exception as e:
             print(f"Error generating LLM response: {e}")
             return "I apologize, but I couldn't generate a response at the moment."
+
+        if cache_vector is not None:
+            self.semantic_cache.put(cache_vector, answer)
+        return answer
     
+    async def generate_responses_batch(self, prompts: List[str], temperature: float = 0.7, max_parallel: int = 5) -> List[str]:
+        """Generate responses for several prompts with bounded concurrency."""
+        semaphore = asyncio.Semaphore(max_parallel)
+
+        async def bounded(prompt: str) -> str:
+            async with semaphore:
+                return await self.generate_response(prompt, temperature)
+
+        return await asyncio.gather(*(bounded(prompt) for prompt in prompts))
+
+    async def generate_and_consume(self, prompt: str, sink, temperature: float = 0.7) -> str:
+        """
+        Stream a completion, feeding each token to sink as it arrives and
+        returning the assembled text. Callers that do incremental work with
+        the output (serialization, socket writes, progress reporting) can
+        overlap it with generation instead of waiting for the full reply,
+        cutting effective latency to time-to-first-token plus the tail.
+        """
+        parts = []
+        async for token in self.generate_response_stream(prompt, temperature):
+            parts.append(token)
+            sink(token)
+        return "".join(parts)
+
     async def generate_response_stream(self, prompt: str, temperature: float = 0.7) -> AsyncGenerator[str, None]:
         """Stream response generation from the LLM."""
         messages = [
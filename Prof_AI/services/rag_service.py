@@ -2,13 +2,26 @@
 RAG Service - Handles Retrieval-Augmented Generation
 """
 
+import asyncio
+
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import StrOutputParser
+from langchain_core.runnables import RunnableLambda
 from langchain_community.vectorstores import Chroma
 from langchain_groq import ChatGroq
-from typing import List, Any
+from typing import List, Any, NamedTuple
 import config
 
+# Emitted by the QA prompt when the context lacks an answer. The phrase is
+# instructed to lead the reply, so only a short prefix needs checking.
+_NO_ANSWER_SENTINEL = "I cannot find the answer"
+_SENTINEL_WINDOW = 100
+
+class RagResult(NamedTuple):
+    """RAG answer text plus a structured no-answer signal for callers."""
+    answer: str
+    no_answer: bool
+
 class RAGService:
     """Service for RAG-based question answering."""
     
@@ -17,9 +30,8 @@ class RAGService:
 
         if vectorstore is None:
             if config.USE_CHROMA_CLOUD:
-                from core.cloud_vectorizer import CloudVectorizer
-                cloud_vectorizer = CloudVectorizer()
-                self.vectorstore = cloud_vectorizer.get_vector_store()
+                from core.cloud_vectorizer import get_cloud_vectorizer
+                self.vectorstore = get_cloud_vectorizer().get_vector_store()
             else:
                 from core.vectorizer import Vectorizer
                 embeddings = OpenAIEmbeddings(model=config.EMBEDDING_MODEL_NAME, openai_api_key=config.OPENAI_API_KEY, chunk_size=200)
@@ -52,9 +64,27 @@ class RAGService:
         def format_docs(docs: List[Any]) -> str:
             return "\n\n".join(doc.page_content for doc in docs)
 
+        use_two_stage = config.USE_TWO_STAGE_RETRIEVAL and config.USE_CHROMA_CLOUD
+
+        def get_context(x):
+            if use_two_stage:
+                return format_docs(self._retrieve_two_stage(x["question"]))
+            return format_docs(self.retriever.invoke(x["question"]))
+
+        async def aget_context(x):
+            # Async retrieval keeps the event loop free during the embed +
+            # vector store round-trips instead of blocking the worker.
+            if use_two_stage:
+                docs = await asyncio.get_running_loop().run_in_executor(
+                    None, self._retrieve_two_stage, x["question"]
+                )
+            else:
+                docs = await self.retriever.ainvoke(x["question"])
+            return format_docs(docs)
+
         self.rag_chain = (
             {
-                "context": lambda x: format_docs(self.retriever.invoke(x["question"])),
+                "context": RunnableLambda(get_context, afunc=aget_context),
                 "question": lambda x: x["question"],
                 "response_language": lambda x: x["response_language"]
             }
@@ -63,14 +93,23 @@ class RAGService:
             | StrOutputParser()
         )
     
-    async def get_answer(self, question: str, response_language: str = "English") -> str:
+    def _retrieve_two_stage(self, question: str):
+        """Retrieve via the coarse-scan + rerank path on ChromaDB Cloud."""
+        from core.cloud_vectorizer import get_cloud_vectorizer
+        return get_cloud_vectorizer().retrieve(question, k=config.RETRIEVAL_K)
+
+    async def get_answer(self, question: str, response_language: str = "English") -> RagResult:
         """Get an answer using the RAG chain."""
         try:
             answer = await self.rag_chain.ainvoke({
                 "question": question,
                 "response_language": response_language
             })
-            return answer
+            # Bounded prefix scan instead of searching the whole answer body
+            return RagResult(
+                answer=answer,
+                no_answer=_NO_ANSWER_SENTINEL in answer[:_SENTINEL_WINDOW]
+            )
         except Exception as e:
             print(f"Error in RAG chain: {e}")
             raise e
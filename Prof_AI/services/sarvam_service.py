@@ -7,6 +7,7 @@ import asyncio
 import time
 import io
 import base64
+from functools import lru_cache
 from typing import AsyncGenerator, Optional
 from sarvamai import AsyncSarvamAI, AudioOutput
 from typing import Optional
@@ -17,10 +18,22 @@ class SarvamService:
     
     def __init__(self):
         from concurrent.futures import ThreadPoolExecutor
+        import httpx
         from sarvamai import SarvamAI
         self.executor = ThreadPoolExecutor(max_workers=6)  # Increased for parallel processing
-        self.sync_client = SarvamAI(api_subscription_key=config.SARVAM_API_KEY)
-        self.client = AsyncSarvamAI(api_subscription_key=config.SARVAM_API_KEY)  # Match Contelligence naming
+        # Pooled keep-alive clients shared by all translate/STT/TTS calls, so
+        # each request reuses a warm connection instead of paying a fresh
+        # TCP+TLS handshake.
+        limits = httpx.Limits(max_keepalive_connections=64, max_connections=128)
+        timeout = httpx.Timeout(60.0, connect=5.0)
+        self.sync_client = SarvamAI(
+            api_subscription_key=config.SARVAM_API_KEY,
+            httpx_client=httpx.Client(limits=limits, timeout=timeout),
+        )
+        self.client = AsyncSarvamAI(  # Match Contelligence naming
+            api_subscription_key=config.SARVAM_API_KEY,
+            httpx_client=httpx.AsyncClient(limits=limits, timeout=timeout),
+        )
     
     def _translate_sync(self, text: str, target_language_code: str, source_language_code: str) -> str:
         """Synchronously translate text using Sarvam AI."""
@@ -807,6 +820,15 @@ class SarvamService:
                 sentence += sentences[i + 1]
             if sentence.strip():
                 result.append(sentence.strip())
-        
+
         return result
-    
+
+
+@lru_cache(maxsize=1)
+def get_sarvam_service() -> SarvamService:
+    """
+    Returns a process-wide SarvamService instance so every caller shares the
+    same HTTP connection pools and thread pool executor.
+    """
+    return SarvamService()
+
@@ -111,14 +111,14 @@ class TranscriptionService:
         """Transcribe using Sarvam AI speech-to-text."""
         try:
             # Check if Sarvam service is available
-            from services.sarvam_service import SarvamService
+            from services.sarvam_service import get_sarvam_service
             from config import SARVAM_API_KEY
-            
+
             if not SARVAM_API_KEY:
                 logging.info("Sarvam API key not available")
                 return None
-            
-            sarvam_service = SarvamService()
+
+            sarvam_service = get_sarvam_service()
             
             # Use Sarvam's speech-to-text if available
             # Note: This would need to be implemented in SarvamService
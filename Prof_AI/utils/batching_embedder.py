@@ -0,0 +1,97 @@
+"""
+Batching Embedder - Coalesces concurrent single-query embeds into one request
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from typing import List, Optional, Tuple
+
+from langchain_core.embeddings import Embeddings
+
+logger = logging.getLogger(__name__)
+
+# How long a lone query waits for company before being sent anyway
+BATCH_WINDOW_SECONDS = 0.010
+# Queries per upstream embed_documents call
+MAX_BATCH_SIZE = 32
+
+
+class BatchingEmbedder(Embeddings):
+    """
+    Proxy around an embeddings client that micro-batches query embeds.
+
+    Under concurrent load, N simultaneous ask_question calls each fire a
+    one-item embed call, so per-request HTTP/TLS overhead dominates the
+    actual compute. langchain's Chroma wrapper has no native async search —
+    retrieval runs the sync similarity_search on executor threads — so the
+    batching lives in the sync embed_query: callers park behind a short
+    window (BATCH_WINDOW_SECONDS) on a shared worker thread, which drains up
+    to MAX_BATCH_SIZE pending queries into one embed_documents call and fans
+    the vectors back out through per-caller futures. A lone query only pays
+    the 10ms window, noise next to the embed round-trip. aembed_query awaits
+    the same future without blocking the event loop.
+
+    Document embedding passes straight through.
+    """
+
+    def __init__(self, upstream: Embeddings):
+        self.upstream = upstream
+        self._lock = threading.Lock()
+        self._pending: List[Tuple[str, Future]] = []
+        self._wakeup = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+
+    def _submit(self, text: str) -> Future:
+        future: Future = Future()
+        with self._lock:
+            self._pending.append((text, future))
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._drain_loop, daemon=True)
+                self._worker.start()
+        self._wakeup.set()
+        return future
+
+    def _drain_loop(self):
+        while True:
+            self._wakeup.wait()
+            # Let the batch window elapse so concurrent callers can pile on.
+            time.sleep(BATCH_WINDOW_SECONDS)
+            with self._lock:
+                batch, self._pending = self._pending[:MAX_BATCH_SIZE], self._pending[MAX_BATCH_SIZE:]
+                if not self._pending:
+                    self._wakeup.clear()
+            if not batch:
+                continue
+
+            texts = [text for text, _ in batch]
+            try:
+                if len(texts) > 1:
+                    logger.debug("Coalesced %d query embeds into one request", len(texts))
+                vectors = self.upstream.embed_documents(texts)
+                for (_, future), vector in zip(batch, vectors):
+                    if not future.done():
+                        future.set_result(vector)
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+
+    @property
+    def model(self):
+        """Upstream model name, so cache wrappers above keep model-scoped keys."""
+        return getattr(self.upstream, "model", "")
+
+    def embed_query(self, text: str) -> List[float]:
+        return self._submit(text).result()
+
+    async def aembed_query(self, text: str) -> List[float]:
+        return await asyncio.wrap_future(self._submit(text))
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self.upstream.embed_documents(texts)
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        return await self.upstream.aembed_documents(texts)
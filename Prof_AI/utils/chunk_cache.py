@@ -0,0 +1,72 @@
+"""
+Chunk Cache - Persistent content-addressed store of chunk embeddings
+"""
+
+import hashlib
+import os
+import sqlite3
+from typing import Dict, Iterable, List
+
+import numpy as np
+
+import config
+
+# Stay well under SQLite's bound-parameter limit per SELECT
+_LOOKUP_WINDOW = 500
+
+
+class ChunkCache:
+    """
+    SQLite-backed map of SHA-256(chunk text) -> embedding vector.
+
+    Re-uploaded PDFs and courses that share text produce byte-identical
+    chunks, so keying vectors by content hash means incremental updates only
+    pay the OpenAI embed call for genuinely new or modified chunks. Vectors
+    are stored as float32 blobs, keyed per embedding model so a model switch
+    never serves stale vectors.
+    """
+
+    def __init__(self, model: str, path: str = None):
+        self.model = model
+        self.path = path or os.path.join(config.VECTORSTORE_DIR, "chunk_embeddings.sqlite3")
+        self._conn = sqlite3.connect(self.path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            " hash TEXT NOT NULL,"
+            " model TEXT NOT NULL,"
+            " vector BLOB NOT NULL,"
+            " PRIMARY KEY (hash, model))"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def key(text: str) -> str:
+        """Content hash used as the cache key for a chunk."""
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, List[float]]:
+        """Returns the cached vectors for whichever of the keys are present."""
+        keys = list(keys)
+        found: Dict[str, List[float]] = {}
+        for i in range(0, len(keys), _LOOKUP_WINDOW):
+            window = keys[i:i + _LOOKUP_WINDOW]
+            placeholders = ",".join("?" for _ in window)
+            rows = self._conn.execute(
+                f"SELECT hash, vector FROM embeddings WHERE model = ? AND hash IN ({placeholders})",
+                [self.model, *window],
+            )
+            for chunk_hash, blob in rows:
+                found[chunk_hash] = np.frombuffer(blob, dtype=np.float32).tolist()
+        return found
+
+    def put_many(self, items: Dict[str, List[float]]):
+        """Persists newly embedded vectors keyed by content hash."""
+        rows = [
+            (chunk_hash, self.model, np.asarray(vector, dtype=np.float32).tobytes())
+            for chunk_hash, vector in items.items()
+        ]
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO embeddings (hash, model, vector) VALUES (?, ?, ?)",
+            rows,
+        )
+        self._conn.commit()
@@ -0,0 +1,111 @@
+"""
+Embedding Cache - Caches query embeddings keyed by content hash
+"""
+
+import hashlib
+import logging
+from collections import OrderedDict
+from typing import List, Optional
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+import config
+
+logger = logging.getLogger(__name__)
+
+# Redis entries expire after 24 hours
+CACHE_TTL_SECONDS = 24 * 60 * 60
+
+
+class CachingEmbeddings(Embeddings):
+    """
+    Proxy around an embeddings client that caches query vectors.
+
+    Repeated or near-identical queries are served from a bounded in-process
+    LRU (and optionally Redis, when config.REDIS_URL is set) instead of
+    paying the OpenAI embed round-trip on every call. Keys are a blake2b
+    hash of the model name plus the normalized query text, so hits are a
+    dict lookup / memcpy rather than a network request.
+    """
+
+    def __init__(self, upstream: Embeddings, maxsize: int = 4096):
+        self.upstream = upstream
+        self.maxsize = maxsize
+        self._local: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._redis = self._connect_redis()
+
+    def _connect_redis(self):
+        """Connect to Redis if configured; the cache works without it."""
+        if not config.REDIS_URL:
+            return None
+        try:
+            import redis
+            client = redis.Redis.from_url(config.REDIS_URL)
+            client.ping()
+            logger.info("Redis embedding cache connected")
+            return client
+        except Exception as e:
+            logger.warning(f"Redis embedding cache unavailable, using in-memory only: {e}")
+            return None
+
+    def _key(self, text: str) -> str:
+        model = getattr(self.upstream, "model", "")
+        payload = f"{model}:{text.strip().lower()}".encode("utf-8")
+        return "emb:" + hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+    def _get(self, key: str) -> Optional[List[float]]:
+        if key in self._local:
+            self._local.move_to_end(key)
+            return self._local[key]
+        if self._redis is not None:
+            try:
+                raw = self._redis.get(key)
+                if raw:
+                    vector = np.frombuffer(raw, dtype=np.float32).tolist()
+                    self._put_local(key, vector)
+                    return vector
+            except Exception as e:
+                logger.debug(f"Redis embedding cache read failed: {e}")
+        return None
+
+    def _put_local(self, key: str, vector: List[float]):
+        self._local[key] = vector
+        self._local.move_to_end(key)
+        while len(self._local) > self.maxsize:
+            self._local.popitem(last=False)
+
+    def _put(self, key: str, vector: List[float]):
+        self._put_local(key, vector)
+        if self._redis is not None:
+            try:
+                raw = np.asarray(vector, dtype=np.float32).tobytes()
+                self._redis.setex(key, CACHE_TTL_SECONDS, raw)
+            except Exception as e:
+                logger.debug(f"Redis embedding cache write failed: {e}")
+
+    def embed_query(self, text: str) -> List[float]:
+        key = self._key(text)
+        cached = self._get(key)
+        if cached is not None:
+            return cached
+        vector = self.upstream.embed_query(text)
+        self._put(key, vector)
+        return vector
+
+    async def aembed_query(self, text: str) -> List[float]:
+        key = self._key(text)
+        cached = self._get(key)
+        if cached is not None:
+            return cached
+        vector = await self.upstream.aembed_query(text)
+        self._put(key, vector)
+        return vector
+
+    # Document embedding is ingestion-time work on mostly-unique texts, so it
+    # passes straight through to the upstream client.
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self.upstream.embed_documents(texts)
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        return await self.upstream.aembed_documents(texts)
@@ -0,0 +1,59 @@
+"""
+OpenAI Clients - Shared, connection-pooled OpenAI client instances
+"""
+
+import functools
+
+import httpx
+from langchain_openai import OpenAIEmbeddings
+
+import config
+
+# Texts per embeddings request for the shared client
+EMBED_BATCH_SIZE = 256
+
+
+@functools.lru_cache(maxsize=1)
+def get_embeddings() -> OpenAIEmbeddings:
+    """
+    Returns the process-wide OpenAIEmbeddings client.
+
+    DocumentProcessor and Vectorizer used to each construct their own
+    instance, so embed calls from different components could never reuse
+    each other's TCP/TLS connections. Sharing one instance keeps a single
+    keep-alive pool (and pays tokenizer setup once).
+
+    With USE_LOCAL_EMBEDDINGS the shared client is instead a small local
+    sentence-transformers model: milliseconds per vector, no network and no
+    per-token cost, at some retrieval-accuracy cost versus OpenAI.
+    """
+    if config.USE_LOCAL_EMBEDDINGS:
+        return _build_local_embeddings()
+    return OpenAIEmbeddings(
+        model=config.EMBEDDING_MODEL_NAME,
+        openai_api_key=config.OPENAI_API_KEY,
+        chunk_size=EMBED_BATCH_SIZE,
+        max_retries=6,
+        http_client=httpx.Client(
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+        ),
+    )
+
+
+def _build_local_embeddings():
+    """Builds the local sentence-transformers backend (needs that extra installed)."""
+    from langchain_community.embeddings import HuggingFaceEmbeddings
+
+    device = "cpu"
+    try:
+        import torch
+        if torch.cuda.is_available():
+            device = "cuda"
+    except ImportError:
+        pass
+
+    return HuggingFaceEmbeddings(
+        model_name=config.LOCAL_EMBEDDING_MODEL_NAME,
+        model_kwargs={"device": device},
+        encode_kwargs={"batch_size": 64, "normalize_embeddings": True},
+    )
@@ -2,19 +2,32 @@
 Response Validator - Validates LLM responses to prevent garbage output
 """
 
-import re
+# The regex package (API-compatible with re) handles large character
+# classes with far fewer engine states; fall back to stdlib re without it.
+try:
+    import regex as re
+except ImportError:
+    import re
+import string
 import logging
+from collections import Counter
 
 class ResponseValidator:
     """Validates LLM responses for quality and coherence."""
-    
+
     # Patterns that indicate garbage or low-quality responses
     GARBAGE_PATTERNS = [
         r'^[\W_]{10,}$',  # Only special characters
         r'(.)\1{20,}',     # Same character repeated 20+ times
-        r'^[^a-zA-Z\u0900-\u097F\u0980-\u09FF\u0A00-\u0A7F\u0A80-\u0AFF\u0B00-\u0B7F\u0C00-\u0C7F\u0C80-\u0CFF\u0D00-\u0D7F\u0600-\u06FF]{50,}$',  # No readable characters
+        # No readable characters: Latin, the contiguous Indic block run
+        # (Devanagari through Malayalam) or Arabic
+        r'^[^a-zA-Z\u0900-\u0D7F\u0600-\u06FF]{50,}$',
     ]
-    
+    # Compiled once at class load; every LLM reply passes through these
+    _COMPILED_GARBAGE_PATTERNS = [re.compile(p) for p in GARBAGE_PATTERNS]
+    # Deletes ASCII letters, leaving non-letters behind (see alpha count below)
+    _NON_ALPHA_TABLE = str.maketrans('', '', string.ascii_letters)
+
     @staticmethod
     def is_valid_response(response: str, min_length: int = 5, max_repetition: int = 5) -> bool:
         """
@@ -38,28 +51,34 @@ class ResponseValidator:
             return False
         
         # Check for garbage patterns
-        for pattern in ResponseValidator.GARBAGE_PATTERNS:
-            if re.search(pattern, response):
-                logging.warning(f"Garbage pattern detected: {pattern}")
+        for pattern in ResponseValidator._COMPILED_GARBAGE_PATTERNS:
+            if pattern.search(response):
+                logging.warning(f"Garbage pattern detected: {pattern.pattern}")
                 return False
         
         # Check for excessive word repetition
         words = response.split()
         if len(words) > 10:  # Only check if response has enough words
-            word_counts = {}
-            for word in words:
-                word_lower = word.lower().strip('.,!?;:')
-                if len(word_lower) > 3:  # Only count meaningful words
-                    word_counts[word_lower] = word_counts.get(word_lower, 0) + 1
-            
-            # Check if any word appears too many times
-            for word, count in word_counts.items():
+            word_counts = Counter(
+                word_lower
+                for word in words
+                if len(word_lower := word.lower().strip('.,!?;:')) > 3  # Only count meaningful words
+            )
+            # Only the single most common word can trip the threshold
+            if word_counts:
+                word, count = word_counts.most_common(1)[0]
                 if count > max_repetition and count > len(words) * 0.3:
                     logging.warning(f"Excessive repetition of word '{word}': {count} times")
                     return False
         
-        # Check for reasonable character distribution
-        alpha_count = sum(1 for c in response if c.isalpha())
+        # Check for reasonable character distribution. For ASCII text the
+        # letter count is length minus what survives deleting all letters via
+        # a translate table (a single C pass); non-ASCII scripts keep the
+        # per-character unicode isalpha path.
+        if response.isascii():
+            alpha_count = len(response) - len(response.translate(ResponseValidator._NON_ALPHA_TABLE))
+        else:
+            alpha_count = sum(1 for c in response if c.isalpha())
         total_chars = len(response)
         
         if total_chars > 20 and alpha_count / total_chars < 0.3:
@@ -0,0 +1,129 @@
+"""
+Semantic Cache - Serves stored LLM answers for semantically similar queries
+"""
+
+import json
+import logging
+import os
+import threading
+from typing import List, Optional
+
+import faiss
+import numpy as np
+
+import config
+
+logger = logging.getLogger(__name__)
+
+# Cap on cached completions; inserts stop once reached
+MAX_ENTRIES = 1024
+
+
+class SemanticCache:
+    """
+    Similarity cache in front of the LLM: query embeddings go into a small
+    FAISS IndexFlatIP (exact inner product over L2-normalized vectors, i.e.
+    cosine), and a lookup that lands above the similarity threshold returns
+    the stored completion without an LLM call. Entries persist to disk so
+    the cache survives restarts.
+
+    Multiple worker processes share the on-disk files, so loads validate
+    that the index and responses list line up (a reader can catch files
+    written by two different workers) and lookups never raise — a broken or
+    torn cache degrades to a miss. Persistence runs on a background thread
+    with atomic renames, off the request path.
+    """
+
+    def __init__(self, name: str = "semantic_cache", threshold: float = None):
+        self.threshold = threshold if threshold is not None else config.SEMANTIC_CACHE_THRESHOLD
+        self._index_path = os.path.join(config.VECTORSTORE_DIR, f"{name}.faiss")
+        self._responses_path = os.path.join(config.VECTORSTORE_DIR, f"{name}.json")
+        self.index = None
+        self.responses: List[str] = []
+        self._lock = threading.Lock()
+        self._persist_pending = False
+        self._load()
+
+    def _load(self):
+        try:
+            if os.path.exists(self._index_path) and os.path.exists(self._responses_path):
+                index = faiss.read_index(self._index_path)
+                with open(self._responses_path, encoding="utf-8") as f:
+                    responses = json.load(f)
+                if index.ntotal != len(responses):
+                    # Files written by different workers; a stale pair would
+                    # send lookups out of bounds.
+                    logger.warning(
+                        f"Semantic cache files out of sync ({index.ntotal} vectors vs "
+                        f"{len(responses)} responses); starting empty"
+                    )
+                    return
+                self.index = index
+                self.responses = responses
+                logger.info(f"Semantic cache loaded with {len(self.responses)} entries")
+        except Exception as e:
+            logger.warning(f"Could not load semantic cache, starting empty: {e}")
+            self.index = None
+            self.responses = []
+
+    def _schedule_persist(self):
+        with self._lock:
+            if self._persist_pending:
+                return
+            self._persist_pending = True
+        threading.Thread(target=self._persist, daemon=True).start()
+
+    def _persist(self):
+        try:
+            with self._lock:
+                self._persist_pending = False
+                index = faiss.clone_index(self.index)
+                responses = list(self.responses)
+            # Write-then-rename so concurrent readers never see a torn file.
+            faiss.write_index(index, self._index_path + ".tmp")
+            with open(self._responses_path + ".tmp", "w", encoding="utf-8") as f:
+                json.dump(responses, f, ensure_ascii=False)
+            os.replace(self._index_path + ".tmp", self._index_path)
+            os.replace(self._responses_path + ".tmp", self._responses_path)
+        except Exception as e:
+            logger.warning(f"Could not persist semantic cache: {e}")
+
+    @staticmethod
+    def _normalize(vector: List[float]) -> np.ndarray:
+        q = np.asarray([vector], dtype=np.float32)
+        faiss.normalize_L2(q)
+        return q
+
+    def get(self, vector: List[float]) -> Optional[str]:
+        """
+        Returns the cached answer nearest to the vector, if similar enough.
+        Never raises: any inconsistency is treated as a miss.
+        """
+        try:
+            with self._lock:
+                if self.index is None or self.index.ntotal == 0:
+                    return None
+                scores, ids = self.index.search(self._normalize(vector), 1)
+                nearest = int(ids[0][0])
+                if scores[0][0] >= self.threshold and 0 <= nearest < len(self.responses):
+                    logger.info(f"Semantic cache hit (similarity {scores[0][0]:.3f})")
+                    return self.responses[nearest]
+        except Exception as e:
+            logger.warning(f"Semantic cache lookup failed: {e}")
+        return None
+
+    def put(self, vector: List[float], response: str):
+        """Stores a completion under its query embedding; never raises."""
+        try:
+            q = self._normalize(vector)
+            with self._lock:
+                if self.index is None:
+                    self.index = faiss.IndexFlatIP(q.shape[1])
+                if self.index.ntotal >= MAX_ENTRIES:
+                    logger.debug("Semantic cache full; skipping insert")
+                    return
+                self.index.add(q)
+                self.responses.append(response)
+            self._schedule_persist()
+        except Exception as e:
+            logger.warning(f"Semantic cache insert failed: {e}")